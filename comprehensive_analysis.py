@@ -0,0 +1,494 @@
+"""
+COMPREHENSIVE ANALYSIS SCRIPT FOR SYSTEMATIC REVIEW
+====================================================
+Input: DissertationIncluded.csv (81 studies exported from Rayyan)
+Output: All statistics, frequencies, and percentages reported in the dissertation
+Note: This analysis was done early on in the project and supported the base for visualisations, however, liberty has been taken to make minimal changes based on manual verification so the numbers on visualisations might differ accordingly.
+"""
+
+import numpy as np
+import re
+import csv
+import functools
+import json
+from pathlib import Path
+from collections import Counter
+
+try:
+    import ahocorasick  # pyahocorasick, optional
+except ImportError:
+    ahocorasick = None
+
+# ==============================================================================
+# KEYWORD DICTIONARIES (Sections 3, 6, 7, 8, 9)
+# ==============================================================================
+# A study counts towards a category if its lower-cased title + abstract
+# contains any of the category's keywords as a substring.
+
+# Research methodology keywords (Section 3)
+methodology_keywords = {
+    'Theoretical/Conceptual': ['theoretical', 'conceptual', 'framework', 'model', 'architecture', 'proposed'],
+    'Experimental': ['experiment', 'experimental', 'test', 'evaluation'],
+    'Prototype/Implementation': ['prototype', 'implementation', 'deployed', 'developed system'],
+    'Simulation': ['simulation', 'simulated', 'simulate'],
+    'Survey/Review': ['survey', 'review', 'systematic review', 'literature']
+}
+
+# Theme keywords (Section 6)
+theme_keywords = {
+    'Security & Privacy': ['security', 'privacy', 'authentication', 'encryption', 'attack', 'vulnerability', 'trust', 'cyber'],
+    'Payment & Transaction Systems': ['payment', 'transaction', 'billing', 'cryptocurrency', 'micropayment', 'settlement'],
+    'Scalability & Performance': ['scalability', 'scalable', 'performance', 'throughput', 'latency', 'optimization'],
+    'Energy Trading': ['energy trading', 'peer-to-peer energy', 'p2p energy', 'energy market', 'trading'],
+    'Sustainability': ['sustainability', 'sustainable', 'carbon', 'renewable', 'green', 'environmental'],
+    'Smart Contracts': ['smart contract'],
+    'IoT Integration': ['iot', 'internet of things', 'sensor', 'device'],
+    'V2G/V2V Integration': ['vehicle-to-grid', 'v2g', 'vehicle-to-vehicle', 'v2v', 'bidirectional']
+}
+
+# Application domain keywords (Section 7)
+application_keywords = {
+    'Payment Systems': ['payment', 'transaction', 'billing', 'financial'],
+    'Charging Infrastructure Management': ['charging infrastructure', 'charging station', 'charging network'],
+    'Energy Trading Platforms': ['energy trading', 'trading platform', 'energy market'],
+    'Supply Chain Traceability': ['supply chain', 'traceability', 'provenance', 'battery lifecycle'],
+    'Authentication & Access Control': ['authentication', 'access control', 'authorization'],
+    'Traffic Management': ['traffic', 'routing', 'navigation'],
+    'V2G Operational Systems': ['v2g', 'vehicle-to-grid operation']
+}
+
+# Blockchain platform keywords (Section 8)
+platform_keywords = {
+    'Ethereum': ['ethereum'],
+    'Hyperledger Fabric': ['hyperledger fabric', 'hyperledger'],
+    'Consortium/Private': ['consortium', 'private blockchain', 'permissioned'],
+    'DAG-based': ['dag', 'directed acyclic graph', 'tangle', 'iota']
+}
+
+# Implementation challenge keywords (Section 9)
+challenge_keywords = {
+    'Latency & Real-time Performance': ['latency', 'real-time', 'delay', 'response time'],
+    'Scalability Limitations': ['scalability challenge', 'scalability issue', 'scalability limitation', 'throughput limitation'],
+    'Energy Consumption': ['energy consumption', 'power consumption', 'energy intensive', 'computational cost'],
+    'Security Vulnerabilities': ['security vulnerability', 'security risk', 'attack vector', '51% attack'],
+    'Regulatory Uncertainty': ['regulation', 'regulatory', 'policy', 'legal', 'compliance'],
+    'Privacy Concerns': ['privacy concern', 'privacy challenge', 'data protection'],
+    'Interoperability': ['interoperability challenge', 'interoperability issue', 'compatibility'],
+    'Adoption Barriers': ['adoption barrier', 'adoption challenge']
+}
+
+all_keyword_dicts = {
+    'methodology': methodology_keywords,
+    'theme': theme_keywords,
+    'application': application_keywords,
+    'platform': platform_keywords,
+    'challenge': challenge_keywords
+}
+
+# combined_text is lower-cased once, so lower-case the keywords once here too and match case-sensitively
+for categories in all_keyword_dicts.values():
+    for category, keywords in categories.items():
+        categories[category] = [keyword.lower() for keyword in keywords]
+
+# Unified {(section, category): keywords} mapping so all categories are counted in one pass
+keyword_categories = {
+    (section, category): keywords
+    for section, categories in all_keyword_dicts.items()
+    for category, keywords in categories.items()
+}
+
+# ==============================================================================
+# KEYWORD COUNTING HELPERS
+# ==============================================================================
+
+def contains_any(series, keywords):
+    """Flag the studies whose (lower-cased) text contains at least one of the keywords"""
+    pattern = '|'.join(re.escape(k) for k in keywords)
+    return series.str.contains(pattern, regex=True, na=False).to_numpy(dtype=bool)
+
+def unique_keywords(categories):
+    """List the distinct keywords of a {(section, category): keywords} mapping, in definition order"""
+    return list(dict.fromkeys(keyword for keywords in categories.values() for keyword in keywords))
+
+def pack_strings(strings):
+    """Encode strings as one contiguous UTF-8 byte buffer plus start offsets"""
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(b) for b in encoded])
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+# Plain range until numba_scan_kernel() swaps in numba.prange; Numba reads this global when it compiles
+prange = range
+
+def _scan_keywords(doc_bytes, doc_offsets, kw_bytes, kw_offsets, hits):
+    """Set hits[i, j] = 1 when document i contains keyword j as a byte substring"""
+    for i in prange(len(doc_offsets) - 1):
+        doc_start, doc_end = doc_offsets[i], doc_offsets[i + 1]
+        for j in range(len(kw_offsets) - 1):
+            kw_start, kw_end = kw_offsets[j], kw_offsets[j + 1]
+            kw_len = kw_end - kw_start
+            for start in range(doc_start, doc_end - kw_len + 1):
+                matched = True
+                for k in range(kw_len):
+                    if doc_bytes[start + k] != kw_bytes[kw_start + k]:
+                        matched = False
+                        break
+                if matched:
+                    hits[i, j] = 1
+                    break
+
+@functools.lru_cache(maxsize=None)
+def numba_scan_kernel():
+    """Import numba on first use and wrap _scan_keywords in a parallel njit dispatcher; None without numba"""
+    global prange
+    try:
+        import numba  # optional
+    except ImportError:
+        return None
+    prange = numba.prange
+    return numba.njit(parallel=True, cache=True)(_scan_keywords)
+
+def build_keyword_automaton(categories):
+    """Build one Aho-Corasick automaton mapping every keyword to the (section, category) pairs that own it"""
+    owners = {}
+    for key, keywords in categories.items():
+        for keyword in keywords:
+            owners.setdefault(keyword, set()).add(key)
+    automaton = ahocorasick.Automaton()
+    for keyword, owner in owners.items():
+        automaton.add_word(keyword, frozenset(owner))
+    automaton.make_automaton()
+    return automaton
+
+def mark_category_hits(automaton, texts, column, matrix):
+    """Set matrix[row, column[key]] = 1 for every (section, category) key hit by the text at each row"""
+    for row, text in enumerate(texts):
+        for _, owner in automaton.iter(text):
+            for key in owner:
+                matrix[row, column[key]] = 1
+
+def category_matrix(series, categories):
+    """Build a studies x categories uint8 matrix using pyahocorasick, then Numba, then pandas str.contains"""
+    column = {key: j for j, key in enumerate(categories)}
+    matrix = np.zeros((len(series), len(column)), dtype=np.uint8)
+    if ahocorasick is not None:
+        automaton = build_keyword_automaton(categories)
+        mark_category_hits(automaton, series.fillna(''), column, matrix)
+    elif numba_scan_kernel() is not None:
+        keywords = unique_keywords(categories)
+        keyword_column = {keyword: j for j, keyword in enumerate(keywords)}
+        doc_bytes, doc_offsets = pack_strings(series.fillna(''))
+        kw_bytes, kw_offsets = pack_strings(keywords)
+        hits = np.zeros((len(doc_offsets) - 1, len(keywords)), dtype=np.int32)
+        numba_scan_kernel()(doc_bytes, doc_offsets, kw_bytes, kw_offsets, hits)
+        for key, category_keywords in categories.items():
+            columns = [keyword_column[k] for k in category_keywords]
+            matrix[:, column[key]] = hits[:, columns].any(axis=1)
+    else:
+        for key, category_keywords in categories.items():
+            matrix[:, column[key]] = contains_any(series, category_keywords)
+    return matrix
+
+def build_feature_matrix(df, categories):
+    """Stack every per-study flag counted in Sections 2-4 and 6-9 into one studies x features uint8 matrix"""
+    flags = {('flag', 'recent_2024_2026'): (df['year'] >= 2024) & (df['year'] <= 2026)}
+    if 'journal' in df.columns:
+        flags[('flag', 'has_journal')] = df['journal'].notna()
+    feature_names = list(categories) + list(flags)
+    features = np.zeros((len(df), len(feature_names)), dtype=np.uint8)
+    features[:, :len(categories)] = category_matrix(df['combined_text'], categories)
+    for j, mask in enumerate(flags.values(), start=len(categories)):
+        features[:, j] = mask.to_numpy(dtype=bool, na_value=False)
+    return feature_names, features
+
+def count_exact_keywords(texts, keywords):
+    """Count whole-word keyword occurrences across lower-cased texts (longest keyword wins where keywords overlap)"""
+    # One capturing group per keyword, so match.lastindex identifies the keyword without hashing the matched text
+    ordered = sorted(range(len(keywords)), key=lambda i: len(keywords[i]), reverse=True)
+    pattern = re.compile('|'.join(r'\b(' + re.escape(keywords[i]) + r')\b' for i in ordered))
+    counts = np.zeros(len(keywords), dtype=np.int64)
+    for text in texts:
+        for match in pattern.finditer(text):
+            counts[ordered[match.lastindex - 1]] += 1
+    return Counter({keyword: int(count) for keyword, count in zip(keywords, counts) if count})
+
+def report_category_counts(section, feature_totals, n_studies):
+    """Print and return the study counts for every category of one section"""
+    section_counts = {}
+    for category in all_keyword_dicts[section]:
+        count = feature_totals[(section, category)]
+        section_counts[category] = count
+        percentage = (count / n_studies) * 100
+        print(f"  {category}: {count} studies ({percentage:.1f}%)")
+    return section_counts
+
+# ==============================================================================
+# DATA LOADING HELPERS
+# ==============================================================================
+
+PARQUET_OPTIONS_KEY = b'comprehensive_analysis.csv_read_options'
+
+def csv_read_options():
+    """Options for parsing the Rayyan export: multithreaded PyArrow reader, text columns as Arrow strings"""
+    import pandas as pd
+    import pyarrow as pa
+    text_columns = {column: pd.ArrowDtype(pa.string()) for column in ['title', 'abstract', 'authors']}
+    return {'encoding': 'utf-8', 'engine': 'pyarrow', 'dtype_backend': 'pyarrow', 'dtype': text_columns}
+
+def parquet_cache_is_current(parquet_path, csv_path, options_fingerprint):
+    """True if the Parquet cache is at least as new as the CSV and was written with the same read options"""
+    import pyarrow.parquet as pq
+    if not parquet_path.exists() or parquet_path.stat().st_mtime < csv_path.stat().st_mtime:
+        return False
+    try:
+        metadata = pq.read_schema(parquet_path).metadata or {}
+    except Exception:  # unreadable or half-written cache; rebuild it
+        return False
+    return metadata.get(PARQUET_OPTIONS_KEY) == options_fingerprint
+
+def write_parquet_cache(df, parquet_path, options_fingerprint):
+    """Cache df as Parquet tagged with its read options; failing to cache is reported, never fatal"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    tmp_path = parquet_path.with_name(parquet_path.name + '.tmp')
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[PARQUET_OPTIONS_KEY] = options_fingerprint
+        pq.write_table(table.replace_schema_metadata(metadata), tmp_path)
+        tmp_path.replace(parquet_path)
+    except OSError as error:
+        tmp_path.unlink(missing_ok=True)
+        print(f"\n! Could not cache parsed data to {parquet_path}: {error}")
+
+def load_studies(csv_path, parquet_path):
+    """Load the studies, reusing the Parquet cache when it is current; returns (df, path actually read)"""
+    import pandas as pd
+    options = csv_read_options()
+    options_fingerprint = json.dumps(options, default=str, sort_keys=True).encode('utf-8')
+    if parquet_cache_is_current(parquet_path, csv_path, options_fingerprint):
+        return pd.read_parquet(parquet_path, dtype_backend='pyarrow'), parquet_path
+    df = pd.read_csv(csv_path, **options)
+    write_parquet_cache(df, parquet_path, options_fingerprint)
+    return df, csv_path
+
+# ==============================================================================
+# ANALYSIS
+# ==============================================================================
+
+def main():
+    """Run Sections 1-10 on DissertationIncluded.csv and write the output files"""
+    # pandas and pyarrow are only needed to run the analysis, not to import the keyword helpers
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    # Set display options
+    pd.set_option('display.max_columns', None)
+    pd.set_option('display.width', None)
+
+    print("="*80)
+    print("SYSTEMATIC REVIEW COMPREHENSIVE ANALYSIS")
+    print("Blockchain Integration in Electric Vehicle Charging Ecosystems")
+    print("="*80)
+
+    # ==============================================================================
+    # SECTION 1: DATA LOADING
+    # ==============================================================================
+    print("\n" + "="*80)
+    print("SECTION 1: LOADING DATA")
+    print("="*80)
+
+    # Reuse the Parquet copy from a previous run unless the CSV or the read options have changed since
+    df, source_path = load_studies(Path('DissertationIncluded.csv'), Path('DissertationIncluded.parquet'))
+    print(f"\n✓ Loaded {len(df)} studies from {source_path}")
+
+    # Display column names
+    print(f"\nColumns in dataset: {list(df.columns)}")
+
+    # Combine title and abstract for analysis, lower-cased once with Arrow's utf8_lower kernel
+    df['combined_text'] = (
+        (df['title'].fillna('') + ' ' + df['abstract'].fillna(''))
+        .astype(pd.ArrowDtype(pa.string()))
+        .str.lower()
+    )
+
+    # Flag every study once for all keyword categories plus the year and journal checks,
+    # then take every count used in Sections 2-4 and 6-9 from a single column sum
+    feature_names, features = build_feature_matrix(df, keyword_categories)
+    feature_totals = dict(zip(feature_names, features.sum(axis=0).tolist()))
+
+    # ==============================================================================
+    # SECTION 2: TEMPORAL DISTRIBUTION
+    # ==============================================================================
+    print("\n" + "="*80)
+    print("SECTION 2: TEMPORAL DISTRIBUTION")
+    print("="*80)
+
+    # Count studies by year (bincount over the bounded year range, keeping only years with studies)
+    years = df['year'].dropna().to_numpy(dtype=np.int16)
+    first_year = int(years.min())
+    year_bins = np.bincount(years - first_year)
+    year_index = np.flatnonzero(year_bins)
+    study_years = year_index + first_year
+    study_counts = year_bins[year_index]
+    year_counts = dict(zip(study_years.tolist(), study_counts.tolist()))
+    print("\nStudies by year:")
+    for year, count in year_counts.items():
+        percentage = (count / len(df)) * 100
+        print(f"  {year}: {count} studies ({percentage:.1f}%)")
+
+    # Calculate growth rates between consecutive publication years
+    print("\nYear-over-year growth rates:")
+    growth_rates = np.diff(study_counts) / study_counts[:-1] * 100
+    for prev_year, curr_year, growth in zip(study_years[:-1], study_years[1:], growth_rates):
+        print(f"  {prev_year} → {curr_year}: {growth:.1f}% growth")
+
+    # Studies in 2024-2026 period
+    recent_count = feature_totals[('flag', 'recent_2024_2026')]
+    recent_percentage = (recent_count / len(df)) * 100
+    print(f"\nStudies in 2024-2026 period: {recent_count} ({recent_percentage:.1f}%)")
+
+    # ==============================================================================
+    # SECTION 3: RESEARCH METHODOLOGIES
+    # ==============================================================================
+    print("\n" + "="*80)
+    print("SECTION 3: RESEARCH METHODOLOGIES")
+    print("="*80)
+
+    print("\nResearch Methodologies:")
+    methodology_counts = report_category_counts('methodology', feature_totals, len(df))
+
+    print("\nNote: Percentages may exceed 100% as studies can employ multiple methodologies")
+
+    # ==============================================================================
+    # SECTION 4: PUBLICATION OUTLETS
+    # ==============================================================================
+    print("\n" + "="*80)
+    print("SECTION 4: PUBLICATION OUTLETS")
+    print("="*80)
+
+    # Count studies with journal information
+    if 'journal' in df.columns:
+        studies_with_journal = feature_totals[('flag', 'has_journal')]
+        percentage = (studies_with_journal / len(df)) * 100
+        print(f"\nStudies with journal information: {studies_with_journal} ({percentage:.1f}%)")
+    else:
+        print("\nNo 'journal' column found in dataset")
+
+    # ==============================================================================
+    # SECTION 5: AUTHOR COLLABORATION
+    # ==============================================================================
+    print("\n" + "="*80)
+    print("SECTION 5: AUTHOR COLLABORATION PATTERNS")
+    print("="*80)
+
+    # Count authors per paper (approximation based on 'and' or ';' in authors field)
+    # assuming semicolon-separated; literal substring count via Arrow, no regex
+    authors = pa.array(df['authors'], type=pa.string())
+    df['author_count'] = pc.add(pc.count_substring(authors, ';'), 1).to_pandas()
+
+    author_stats = df['author_count'].agg(['mean', 'min', 'max'])
+    mean_authors = author_stats['mean']
+    min_authors, max_authors = int(author_stats['min']), int(author_stats['max'])
+    # Mode from one value_counts pass; sort_index keeps the smallest value on ties, like mode()
+    author_count_freq = df['author_count'].value_counts().sort_index()
+    mode_authors = author_count_freq.idxmax()
+    mode_count = author_count_freq[mode_authors]
+
+    print(f"\nAuthor collaboration statistics:")
+    print(f"  Average authors per study: {mean_authors:.2f}")
+    print(f"  Range: {min_authors} to {max_authors} authors")
+    print(f"  Most common: {mode_authors} authors ({mode_count} papers, {(mode_count/len(df)*100):.1f}%)")
+
+    # ==============================================================================
+    # SECTION 6: THEMATIC SYNTHESIS 
+    # ==============================================================================
+    print("\n" + "="*80)
+    print("SECTION 6: THEMATIC SYNTHESIS - 8 MAJOR THEMES")
+    print("="*80)
+
+    print("\nResearch Themes (studies can address multiple themes):")
+    theme_counts = report_category_counts('theme', feature_totals, len(df))
+
+    # ==============================================================================
+    # SECTION 7: APPLICATION DOMAINS 
+    # ==============================================================================
+    print("\n" + "="*80)
+    print("SECTION 7: APPLICATION DOMAINS")
+    print("="*80)
+
+    print("\nApplication Domains:")
+    application_counts = report_category_counts('application', feature_totals, len(df))
+
+    # ==============================================================================
+    # SECTION 8: BLOCKCHAIN PLATFORMS 
+    # ==============================================================================
+    print("\n" + "="*80)
+    print("SECTION 8: BLOCKCHAIN PLATFORMS")
+    print("="*80)
+
+    print("\nBlockchain Platforms mentioned:")
+    platform_counts = report_category_counts('platform', feature_totals, len(df))
+
+    # ==============================================================================
+    # SECTION 9: IMPLEMENTATION CHALLENGES 
+    # ==============================================================================
+    print("\n" + "="*80)
+    print("SECTION 9: IMPLEMENTATION CHALLENGES")
+    print("="*80)
+
+    print("\nImplementation Challenges identified:")
+    challenge_counts = report_category_counts('challenge', feature_totals, len(df))
+
+    # ==============================================================================
+    # SECTION 10: SAVE RESULTS TO FILES
+    # ==============================================================================
+    print("\n" + "="*80)
+    print("SECTION 10: SAVING RESULTS TO OUTPUT FILES")
+    print("="*80)
+
+    # Save all results to CSV files for easy reference, streaming rows straight to disk
+    with open('comprehensive_analysis_results.csv', 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['Metric', 'Value', 'Percentage'])
+
+        # Add temporal data
+        for year, count in year_counts.items():
+            writer.writerow([f'Studies in {year}', count, f'{(count/len(df)*100):.1f}%'])
+
+        # Add methodology data
+        for methodology, count in methodology_counts.items():
+            writer.writerow([methodology, count, f'{(count/len(df)*100):.1f}%'])
+
+        # Add theme data
+        for theme, count in theme_counts.items():
+            writer.writerow([f'Theme: {theme}', count, f'{(count/len(df)*100):.1f}%'])
+    print("\n✓ Results saved to: comprehensive_analysis_results.csv")
+
+    # Save keyword frequency counts
+    all_keywords = unique_keywords(keyword_categories)
+    keyword_frequencies = count_exact_keywords(df['combined_text'], all_keywords)
+    with open('keyword_frequencies.csv', 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['Keyword', 'Frequency'])
+        writer.writerows(keyword_frequencies.most_common())
+    print("✓ Keyword frequencies saved to: keyword_frequencies.csv")
+
+    # ==============================================================================
+    # FINAL SUMMARY
+    # ==============================================================================
+    print("\n" + "="*80)
+    print("ANALYSIS COMPLETE")
+    print("="*80)
+    print(f"\nTotal studies analyzed: {len(df)}")
+    # study_years from Section 2 is already sorted, so no further pass over the year column
+    print(f"Publication period: {study_years[0]} - {study_years[-1]}")
+    print("\nAll results correspond to Chapter 4: Results in the dissertation")
+    print("\nOutput files generated:")
+    print("  1. comprehensive_analysis_results.csv - All metrics and percentages")
+    print("  2. keyword_frequencies.csv - Keyword frequency counts")
+    print("\n" + "="*80)
+
+if __name__ == "__main__":
+    main()